@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from huggingface_hub import snapshot_download
 
@@ -5,6 +7,15 @@ from tests.utils import RemoteOpenAIServer
 
 from .utils import ARGS, CONFIGS, ServerConfig
 
+try:
+    # these tests iterate one SSE chunk per generated token, so the lower
+    # per-wakeup overhead of the libuv loop is worth using when available
+    # (it ships with uvicorn[standard] on Linux)
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 
 # for each server config, download the model and return the config
 @pytest.fixture(scope="session", params=CONFIGS.keys())
@@ -17,7 +28,7 @@ def server_config(request):
 
 # run this for each server config
 @pytest.fixture(scope="session")
-def server(request, server_config: ServerConfig):
+def server(server_config: ServerConfig):
     model = server_config["model"]
     args_for_model = server_config["arguments"]
     with RemoteOpenAIServer(model, ARGS + args_for_model,
@@ -27,4 +38,13 @@ def server(request, server_config: ServerConfig):
 
 @pytest.fixture(scope="session")
 def client(server: RemoteOpenAIServer):
+    # session scope so every test shares one client (and its connection pool)
+    # per server config instead of re-establishing connections per test
     return server.get_async_client()
+
+
+@pytest.fixture(scope="session")
+def model_name(server_config: ServerConfig) -> str:
+    # the server serves the model under the name it was started with, so
+    # tests can use this directly instead of a models.list() round trip each
+    return server_config["model"]
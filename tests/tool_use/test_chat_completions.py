@@ -1,4 +1,4 @@
-from typing import List
+import asyncio
 
 import openai
 import pytest
@@ -10,15 +10,22 @@ from .utils import MESSAGES_WITHOUT_TOOLS, WEATHER_TOOL
 # are enabled. This makes sure tool call chat templates work, AND that the tool
 # parser stream processing doesn't change the output of the model.
 @pytest.mark.asyncio
-async def test_chat_completion_without_tools(client: openai.AsyncOpenAI):
-    models = await client.models.list()
-    model_name: str = models.data[0].id
-    chat_completion = await client.chat.completions.create(
-        messages=MESSAGES_WITHOUT_TOOLS,
-        temperature=0,
-        max_tokens=150,
-        model=model_name,
-        logprobs=False)
+async def test_chat_completion_without_tools(client: openai.AsyncOpenAI,
+                                             model_name: str):
+    # issue the non-streaming and streaming requests concurrently so the
+    # server batches them; temperature=0 keeps the outputs comparable
+    chat_completion, stream = await asyncio.gather(
+        client.chat.completions.create(messages=MESSAGES_WITHOUT_TOOLS,
+                                       temperature=0,
+                                       max_tokens=150,
+                                       model=model_name,
+                                       logprobs=False),
+        client.chat.completions.create(messages=MESSAGES_WITHOUT_TOOLS,
+                                       temperature=0,
+                                       max_tokens=150,
+                                       model=model_name,
+                                       logprobs=False,
+                                       stream=True))
     choice = chat_completion.choices[0]
     stop_reason = chat_completion.choices[0].finish_reason
     output_text = chat_completion.choices[0].message.content
@@ -32,16 +39,9 @@ async def test_chat_completion_without_tools(client: openai.AsyncOpenAI):
     assert (choice.message.tool_calls is None
             or len(choice.message.tool_calls) == 0)
 
-    # make the same request, streaming
-    stream = await client.chat.completions.create(
-        messages=MESSAGES_WITHOUT_TOOLS,
-        temperature=0,
-        max_tokens=150,
-        model=model_name,
-        logprobs=False,
-        stream=True,
-    )
-    chunks: List[str] = []
+    # bytearray.extend is an amortized O(1) append and the final
+    # decode is a single pass, vs. list append + two-pass join
+    content_buf = bytearray()
     finish_reason_count = 0
     role_sent: bool = False
 
@@ -56,7 +56,7 @@ async def test_chat_completion_without_tools(client: openai.AsyncOpenAI):
             role_sent = True
 
         if delta.content:
-            chunks.append(delta.content)
+            content_buf.extend(delta.content.encode())
 
         if chunk.choices[0].finish_reason is not None:
             finish_reason_count += 1
@@ -69,24 +69,32 @@ async def test_chat_completion_without_tools(client: openai.AsyncOpenAI):
     # were in fact sent, and that the chunks match non-streaming
     assert role_sent
     assert finish_reason_count == 1
-    assert len(chunks)
-    assert "".join(chunks) == output_text
+    assert len(content_buf)
+    assert content_buf.decode() == output_text
 
 
 # test: conversation with tools enabled and provided that should not invoke
 # tools, to make sure we can still get normal chat completion responses
 # and that they won't be parsed as tools
 @pytest.mark.asyncio
-async def test_chat_completion_with_tools(client: openai.AsyncOpenAI):
-    models = await client.models.list()
-    model_name: str = models.data[0].id
-    chat_completion = await client.chat.completions.create(
-        messages=MESSAGES_WITHOUT_TOOLS,
-        temperature=0,
-        max_tokens=150,
-        model=model_name,
-        tools=[WEATHER_TOOL],
-        logprobs=False)
+async def test_chat_completion_with_tools(client: openai.AsyncOpenAI,
+                                          model_name: str):
+    # issue the non-streaming and streaming requests concurrently so the
+    # server batches them; temperature=0 keeps the outputs comparable
+    chat_completion, stream = await asyncio.gather(
+        client.chat.completions.create(messages=MESSAGES_WITHOUT_TOOLS,
+                                       temperature=0,
+                                       max_tokens=150,
+                                       model=model_name,
+                                       tools=[WEATHER_TOOL],
+                                       logprobs=False),
+        client.chat.completions.create(messages=MESSAGES_WITHOUT_TOOLS,
+                                       temperature=0,
+                                       max_tokens=150,
+                                       model=model_name,
+                                       logprobs=False,
+                                       tools=[WEATHER_TOOL],
+                                       stream=True))
     choice = chat_completion.choices[0]
     stop_reason = chat_completion.choices[0].finish_reason
     output_text = chat_completion.choices[0].message.content
@@ -100,18 +108,9 @@ async def test_chat_completion_with_tools(client: openai.AsyncOpenAI):
     assert (choice.message.tool_calls is None
             or len(choice.message.tool_calls) == 0)
 
-    # make the same request, streaming
-    stream = await client.chat.completions.create(
-        messages=MESSAGES_WITHOUT_TOOLS,
-        temperature=0,
-        max_tokens=150,
-        model=model_name,
-        logprobs=False,
-        tools=[WEATHER_TOOL],
-        stream=True,
-    )
-
-    chunks: List[str] = []
+    # bytearray.extend is an amortized O(1) append and the final
+    # decode is a single pass, vs. list append + two-pass join
+    content_buf = bytearray()
     finish_reason_count = 0
     role_sent: bool = False
 
@@ -125,7 +124,7 @@ async def test_chat_completion_with_tools(client: openai.AsyncOpenAI):
             role_sent = True
 
         if delta.content:
-            chunks.append(delta.content)
+            content_buf.extend(delta.content.encode())
 
         if chunk.choices[0].finish_reason is not None:
             finish_reason_count += 1
@@ -139,5 +138,5 @@ async def test_chat_completion_with_tools(client: openai.AsyncOpenAI):
     assert finish_reason_count == 1
     assert chunk.choices[0].finish_reason == stop_reason
     assert chunk.choices[0].finish_reason != 'tool_calls'
-    assert len(chunks)
-    assert "".join(chunks) == output_text
+    assert len(content_buf)
+    assert content_buf.decode() == output_text
@@ -14,9 +14,8 @@ from .utils import (MESSAGES_ASKING_FOR_PARALLEL_TOOLS,
 # may be added in the future. e.g. llama 3.1 models are not designed to support
 # parallel tool calls.
 @pytest.mark.asyncio
-async def test_parallel_tool_calls(client: openai.AsyncOpenAI):
-    models = await client.models.list()
-    model_name: str = models.data[0].id
+async def test_parallel_tool_calls(client: openai.AsyncOpenAI,
+                                   model_name: str):
     chat_completion = await client.chat.completions.create(
         messages=MESSAGES_ASKING_FOR_PARALLEL_TOOLS,
         temperature=0,
@@ -136,9 +135,8 @@ async def test_parallel_tool_calls(client: openai.AsyncOpenAI):
 # test: providing parallel tool calls back to the model to get a response
 # (streaming/not)
 @pytest.mark.asyncio
-async def test_parallel_tool_calls_with_results(client: openai.AsyncOpenAI):
-    models = await client.models.list()
-    model_name: str = models.data[0].id
+async def test_parallel_tool_calls_with_results(client: openai.AsyncOpenAI,
+                                                model_name: str):
     chat_completion = await client.chat.completions.create(
         messages=MESSAGES_WITH_PARALLEL_TOOL_RESPONSE,
         temperature=0,
@@ -166,7 +164,9 @@ async def test_parallel_tool_calls_with_results(client: openai.AsyncOpenAI):
         logprobs=False,
         stream=True)
 
-    chunks: List[str] = []
+    # bytearray.extend is an amortized O(1) append and the final
+    # decode is a single pass, vs. list append + two-pass join
+    content_buf = bytearray()
     finish_reason_count = 0
     role_sent: bool = False
 
@@ -179,7 +179,7 @@ async def test_parallel_tool_calls_with_results(client: openai.AsyncOpenAI):
             role_sent = True
 
         if delta.content:
-            chunks.append(delta.content)
+            content_buf.extend(delta.content.encode())
 
         if chunk.choices[0].finish_reason is not None:
             finish_reason_count += 1
@@ -189,5 +189,5 @@ async def test_parallel_tool_calls_with_results(client: openai.AsyncOpenAI):
 
     assert role_sent
     assert finish_reason_count == 1
-    assert len(chunks)
-    assert "".join(chunks) == choice.message.content
+    assert len(content_buf)
+    assert content_buf.decode() == choice.message.content
@@ -1,5 +1,5 @@
 import json
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
 import openai
 import pytest
@@ -11,9 +11,8 @@ from .utils import (MESSAGES_ASKING_FOR_TOOLS, MESSAGES_WITH_TOOL_RESPONSE,
 # test: request a chat completion that should return tool calls, so we know they
 # are parsable
 @pytest.mark.asyncio
-async def test_tool_call_and_choice(client: openai.AsyncOpenAI):
-    models = await client.models.list()
-    model_name: str = models.data[0].id
+async def test_tool_call_and_choice(client: openai.AsyncOpenAI,
+                                    model_name: str):
     chat_completion = await client.chat.completions.create(
         messages=MESSAGES_ASKING_FOR_TOOLS,
         temperature=0,
@@ -136,9 +135,8 @@ async def test_tool_call_and_choice(client: openai.AsyncOpenAI):
 # test: providing tools and results back to model to get a non-tool response
 # (streaming/not)
 @pytest.mark.asyncio
-async def test_tool_call_with_results(client: openai.AsyncOpenAI):
-    models = await client.models.list()
-    model_name: str = models.data[0].id
+async def test_tool_call_with_results(client: openai.AsyncOpenAI,
+                                      model_name: str):
     chat_completion = await client.chat.completions.create(
         messages=MESSAGES_WITH_TOOL_RESPONSE,
         temperature=0,
@@ -165,7 +163,9 @@ async def test_tool_call_with_results(client: openai.AsyncOpenAI):
         logprobs=False,
         stream=True)
 
-    chunks: List[str] = []
+    # bytearray.extend is an amortized O(1) append and the final
+    # decode is a single pass, vs. list append + two-pass join
+    content_buf = bytearray()
     finish_reason_count = 0
     role_sent: bool = False
 
@@ -178,7 +178,7 @@ async def test_tool_call_with_results(client: openai.AsyncOpenAI):
             role_sent = True
 
         if delta.content:
-            chunks.append(delta.content)
+            content_buf.extend(delta.content.encode())
 
         if chunk.choices[0].finish_reason is not None:
             finish_reason_count += 1
@@ -188,5 +188,5 @@ async def test_tool_call_with_results(client: openai.AsyncOpenAI):
 
     assert role_sent
     assert finish_reason_count == 1
-    assert len(chunks)
-    assert "".join(chunks) == choice.message.content
+    assert len(content_buf)
+    assert content_buf.decode() == choice.message.content
@@ -36,6 +36,10 @@ CONFIGS: Dict[str, ServerConfig] = {
     }
 }
 
+# the tool/message payloads below are plain module-level constants, built
+# once at import. They are deliberately passed through the openai SDK's typed
+# API (not pre-serialized and sent via client.post) so the tests keep
+# exercising the same request validation path real clients use.
 WEATHER_TOOL: ChatCompletionToolParam = {
     "type": "function",
     "function": {
@@ -12,8 +12,8 @@ from vllm.entrypoints.openai.protocol import (DeltaFunctionCall, DeltaMessage,
                                               InitialDeltaToolCall, ToolCall)
 from vllm.entrypoints.openai.tool_parsers.abstract_tool_parser import (
     ToolParser)
-from vllm.entrypoints.openai.tool_parsers.utils import (
-    extract_intermediate_diff)
+from vllm.entrypoints.openai.tool_parsers.utils import (IncrementalJSONDiffer,
+                                                        json_loads)
 from vllm.logger import init_logger
 from vllm.transformers_utils.tokenizer import AnyTokenizer
 
@@ -31,6 +31,8 @@ class Hermes2ProToolParser(ToolParser):
         self.current_tool_initial_sent: bool = False
         self.streamed_args_for_tool: List[str] = [
         ]  # map what has been streamed for each tool so far to a list
+        self.argument_differs: List[IncrementalJSONDiffer] = [
+        ]  # one stateful argument differ per tool call
 
         self.tool_call_start_token: str = "<tool_call>"
         self.tool_call_end_token: str = "</tool_call>"
@@ -75,7 +77,7 @@ class Hermes2ProToolParser(ToolParser):
                 # load the JSON, and then use it to build the Function and
                 # Tool Call
                 raw_function_calls = [
-                    json.loads(match[0] if match[0] else match[1])
+                    json_loads(match[0] if match[0] else match[1])
                     for match in function_call_tuples
                 ]
                 tool_calls = [
@@ -163,6 +165,7 @@ class Hermes2ProToolParser(ToolParser):
                 self.current_tool_name_sent = False
                 self.current_tool_initial_sent = False
                 self.streamed_args_for_tool.append("")
+                self.argument_differs.append(IncrementalJSONDiffer())
                 logger.debug("Starting on a new tool %s", self.current_tool_id)
 
             # case -- we're updating an existing tool call
@@ -298,16 +301,16 @@ class Hermes2ProToolParser(ToolParser):
                 ])
                 self.streamed_args_for_tool[self.current_tool_id] \
                     += arguments_delta
+                self.argument_differs[self.current_tool_id].prime(
+                    cur_arguments_json, len(arguments_delta))
 
             # last case -- we have an update to existing arguments.
             elif cur_arguments and prev_arguments:
 
                 cur_args_json = json.dumps(cur_arguments)
-                prev_args_json = json.dumps(prev_arguments)
-                logger.debug("Searching for diff between\n%s", cur_args_json)
-                logger.debug("and\n%s", prev_args_json)
-                argument_diff = extract_intermediate_diff(
-                    cur_args_json, prev_args_json)
+                logger.debug("Searching for diff within\n%s", cur_args_json)
+                argument_diff = self.argument_differs[
+                    self.current_tool_id].push(cur_args_json)
                 logger.debug("got argument diff %s", argument_diff)
                 delta = DeltaMessage(tool_calls=[
                     DeltaToolCall(index=self.current_tool_id,
@@ -12,8 +12,8 @@ from vllm.entrypoints.openai.protocol import (DeltaFunctionCall, DeltaMessage,
                                               InitialDeltaToolCall, ToolCall)
 from vllm.entrypoints.openai.tool_parsers.abstract_tool_parser import (
     ToolParser)
-from vllm.entrypoints.openai.tool_parsers.utils import (
-    extract_intermediate_diff)
+from vllm.entrypoints.openai.tool_parsers.utils import (IncrementalJSONDiffer,
+                                                        json_loads)
 from vllm.logger import init_logger
 from vllm.transformers_utils.tokenizer import AnyTokenizer
 
@@ -39,6 +39,8 @@ class MistralToolParser(ToolParser):
         self.current_tool_initial_sent: bool = False
         self.streamed_args_for_tool: List[str] = [
         ]  # map what has been streamed for each tool so far to a list
+        self.argument_differs: List[IncrementalJSONDiffer] = [
+        ]  # one stateful argument differ per tool call
         self.bot_token = "[TOOL_CALLS]"
         self.bot_token_id = self.model_tokenizer.vocab[self.bot_token]
         self.tool_call_regex = re.compile(r"\[{.*?}\]", re.DOTALL)
@@ -65,7 +67,7 @@ class MistralToolParser(ToolParser):
 
             # load the JSON, and then use it to build the Function and
             # Tool Call
-            function_call_arr = json.loads(raw_tool_call)
+            function_call_arr = json_loads(raw_tool_call)
             tool_calls: List[ToolCall] = [
                 ToolCall(
                     type="function",
@@ -182,6 +184,7 @@ class MistralToolParser(ToolParser):
                 self.current_tool_name_sent = False
                 self.current_tool_initial_sent = False
                 self.streamed_args_for_tool.append("")
+                self.argument_differs.append(IncrementalJSONDiffer())
                 logger.debug("starting on new tool %d", self.current_tool_id)
                 return delta
 
@@ -249,15 +252,16 @@ class MistralToolParser(ToolParser):
                     ])
                     self.streamed_args_for_tool[
                         self.current_tool_id] += arguments_delta
+                    self.argument_differs[self.current_tool_id].prime(
+                        cur_arguments_json, len(arguments_delta))
 
                 elif cur_arguments and prev_arguments:
                     cur_args_json = json.dumps(cur_arguments)
-                    prev_args_json = json.dumps(prev_arguments)
-                    logger.debug("Searching for diff between \n%s\n%s",
-                                 cur_args_json, prev_args_json)
+                    logger.debug("Searching for diff within \n%s",
+                                 cur_args_json)
 
-                    argument_diff = extract_intermediate_diff(
-                        cur_args_json, prev_args_json)
+                    argument_diff = self.argument_differs[
+                        self.current_tool_id].push(cur_args_json)
                     logger.debug("got arguments diff: %s", argument_diff)
                     delta = DeltaMessage(tool_calls=[
                         DeltaToolCall(index=self.current_tool_id,
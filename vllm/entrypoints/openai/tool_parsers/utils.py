@@ -1,3 +1,58 @@
+"""
+String-diffing helpers for the streaming tool-call parsers.
+
+These run on every streamed token, so they are written to keep the hot
+loops inside CPython's C primitives (memcmp-backed slice compares, regex
+scans, set lookups) rather than per-character Python bytecode. That makes
+an AOT-compiled (Cython/mypyc) variant unnecessary - vLLM's compiled
+extensions are reserved for CUDA/C++ kernels built through CMake.
+"""
+import re
+import string
+from functools import lru_cache
+from itertools import islice
+from typing import Tuple
+
+try:
+    # orjson parses at C speed and accepts both str and bytes; fall back to
+    # the stdlib when it is not installed. Only loads() is aliased here -
+    # the parsers keep stdlib json.dumps so the canonical spacing of the
+    # serialized arguments matches what the model streamed.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# set membership is a plain hash lookup, much cheaper than str.isalnum()
+# which goes through the Unicode database; the JSON handled here is ASCII
+# (json.dumps escapes everything else by default)
+_ALNUM = frozenset(string.ascii_letters + string.digits)
+
+
+def _common_prefix_len(s1: str, s2: str) -> int:
+    """
+    Length of the common prefix of two strings.
+
+    Binary-searches the mismatch position with slice comparisons, which
+    CPython dispatches to memcmp for same-kind (e.g. ASCII JSON) strings -
+    O(log n) vectorized compares instead of one interpreted compare per
+    character.
+    """
+    # fast path: in streaming, one string usually extends the other, so the
+    # shorter one is the common prefix in full - a single memcmp
+    if s2.startswith(s1):
+        return len(s1)
+    if s1.startswith(s2):
+        return len(s2)
+    lo, hi = 0, min(len(s1), len(s2))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if s1[:mid] == s2[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
 def find_common_prefix(s1: str, s2: str) -> str:
     """
     Finds a common prefix that is shared between two strings, if there is one.
@@ -11,32 +66,53 @@ def find_common_prefix(s1: str, s2: str) -> str:
     e.g. find_common_prefix('{"fruit": "ap"}', '{"fruit": "apple"}') ->
     '{"fruit": "ap'
     """
-    prefix = ''
-    min_length = min(len(s1), len(s2))
-    for i in range(0, min_length):
-        if s1[i] == s2[i]:
-            prefix += s1[i]
-        else:
+    return s1[:_common_prefix_len(s1, s2)]
+
+
+@lru_cache(maxsize=256)
+def _suffix_tail(s: str, max_window: int) -> str:
+    """
+    Longest non-alphanumeric tail of a string, capped at max_window chars.
+
+    Cached because streaming reuses the previous `curr` as the next call's
+    `old`, so the same tail is requested on consecutive tokens.
+    """
+    tail_len = 0
+    for c in islice(reversed(s), max_window):
+        if c in _ALNUM:
             break
-    return prefix
+        tail_len += 1
+    return s[-tail_len:] if tail_len else ''
 
 
-def find_common_suffix(s1: str, s2: str) -> str:
+def find_common_suffix(s1: str, s2: str, max_window: int = 16) -> str:
     """
     Finds a common suffix shared between two strings, if there is one. Order of
     arguments is NOT important.
     Stops when the suffix ends OR it hits an alphanumeric character
 
+    The suffixes of interest are the auto-completed JSON closers (`"}`, `"]`
+    and the like), which are only ever a handful of characters, so the scan
+    is capped at `max_window` characters from the end regardless of how long
+    the strings have grown.
+
     e.g. find_common_suffix('{"fruit": "ap"}', '{"fruit": "apple"}') -> '"}'
     """
-    suffix = ''
-    min_length = min(len(s1), len(s2))
-    for i in range(1, min_length + 1):
-        if s1[-i] == s2[-i] and not s1[-i].isalnum():
-            suffix = s1[-i] + suffix
+    # the common suffix under the stop-at-alphanumeric rule is exactly the
+    # common plain suffix of the two (cached) non-alphanumeric tails
+    t1 = _suffix_tail(s1, max_window)
+    t2 = _suffix_tail(s2, max_window)
+    if t2.endswith(t1):
+        return t1
+    if t1.endswith(t2):
+        return t2
+    suffix_len = 0
+    for c1, c2 in zip(reversed(t1), reversed(t2)):
+        if c1 == c2:
+            suffix_len += 1
         else:
             break
-    return suffix
+    return t1[-suffix_len:] if suffix_len else ''
 
 
 def extract_intermediate_diff(curr: str, old: str) -> str:
@@ -57,19 +133,86 @@ def extract_intermediate_diff(curr: str, old: str) -> str:
         -> 'ple'
 
     """
-    suffix = find_common_suffix(curr, old)
+    start, end = _diff_bounds(curr, old)
+    return curr[start:end]
+
 
-    old = old[::-1].replace(suffix[::-1], '', 1)[::-1]
-    prefix = find_common_prefix(curr, old)
-    diff = curr
-    if len(suffix):
-        diff = diff[::-1].replace(suffix[::-1], '', 1)[::-1]
+def _diff_bounds(curr: str, old: str) -> Tuple[int, int]:
+    """
+    Compute (start, end) such that curr[start:end] is the intermediate diff
+    described by extract_intermediate_diff, without materializing the prefix
+    or the trimmed strings.
+    """
+    suffix_len = len(find_common_suffix(curr, old))
+    # the prefix is measured against old with its unstable suffix removed,
+    # mirroring the original two-step computation
+    start = _common_prefix_len(curr, old[:len(old) - suffix_len])
+    end = len(curr) - suffix_len
+    # the prefix and suffix may overlap inside curr; an empty diff is the
+    # sane answer in that degenerate case
+    return start, max(start, end)
 
-    if len(prefix):
-        # replace the prefix only once in case it's mirrored
-        diff = diff.replace(prefix, '', 1)
 
-    return diff
+class IncrementalJSONDiffer:
+    """
+    Stateful helper for diffing successive versions of a partially-parsed
+    JSON string during streaming.
+
+    Calling extract_intermediate_diff(curr, old) on every delta rescans both
+    strings from both ends - O(len(curr)) per token, O(N^2) over a full
+    generation. Since each new version almost always extends the previous one
+    (modulo the auto-completed trailing close-quotes/brackets/braces), it is
+    enough to remember how much of the string has already been emitted and to
+    compare only a short tail window for unstable closers.
+
+    One differ instance tracks one tool call's arguments.
+    """
+
+    def __init__(self, suffix_window: int = 16):
+        self.last: str = ''
+        self.emitted_len: int = 0
+        self.suffix_window = suffix_window
+
+    def prime(self, curr: str, emitted_len: int) -> None:
+        """
+        Seed the differ when the first emitted chunk was computed by other
+        means (e.g. the initial arguments delta located via the delta text).
+        """
+        self.last = curr
+        self.emitted_len = emitted_len
+
+    def push(self, curr: str) -> str:
+        """
+        Record the newest version of the string and return the portion that
+        is now safe to stream - everything past what was already emitted,
+        minus the trailing auto-completed closers.
+        """
+        old = self.last
+        self.last = curr
+
+        # if the already-emitted prefix changed, the stream diverged from the
+        # incremental assumption; fall back to a full diff
+        if curr[:self.emitted_len] != old[:self.emitted_len]:
+            diff = extract_intermediate_diff(curr, old)
+            self.emitted_len = len(curr) - len(find_common_suffix(curr, old))
+            return diff
+
+        # the unstable closers are short, so only the tail window is compared
+        suffix = find_common_suffix(curr, old, self.suffix_window)
+        stable_len = len(curr) - len(suffix)
+        if stable_len <= self.emitted_len:
+            return ''
+
+        diff = curr[self.emitted_len:stable_len]
+        self.emitted_len = stable_len
+        return diff
+
+
+@lru_cache(maxsize=32)
+def _compiled_pattern(substring: str) -> re.Pattern:
+    # wrapped in a lookahead so overlapping occurrences are still reported,
+    # matching the semantics of repeated str.find(substring, index + 1)
+    return re.compile('(?=' + re.escape(substring) + ')')
 
 
 def find_all_indices(string, substring):
@@ -77,11 +220,6 @@ def find_all_indices(string, substring):
     Find all (starting) indices of a substring in a given string. Useful for
     tool call extraction
     """
-    indices = []
-    index = -1
-    while True:
-        index = string.find(substring, index + 1)
-        if index == -1:
-            break
-        indices.append(index)
-    return indices
+    # the substrings are fixed markers like "<tool_call>", so the compiled
+    # pattern is cached and the whole scan runs inside the regex engine
+    return [m.start() for m in _compiled_pattern(substring).finditer(string)]